@@ -5,20 +5,43 @@ It includes various API routers, middleware configurations,
 and an exception handler for rate limiting.
 """
 
+import sys
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi.errors import RateLimitExceeded
-from starlette.responses import JSONResponse
 from src.services.auth import get_current_admin_user
 from src.database.models import User
 
 
 from src.api import auth, contacts, users, utils
 from src.conf import messages
+from src.conf.config import settings
+from src.database.db import sessionmanager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Opens the database pool connections at startup and closes them at shutdown.
+
+    Args:
+        app (FastAPI): The application instance.
+    """
+    try:
+        await sessionmanager.warm_up(settings.DB_POOL_SIZE)
+    except Exception as e:
+        # The pool still opens connections on demand
+        print(e)
+    yield
+    await sessionmanager.close()
 
 # Initialize FastAPI application
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Include API routers
 app.include_router(utils.router, prefix="/api")
@@ -26,6 +49,9 @@ app.include_router(contacts.router, prefix="/api")
 app.include_router(auth.router, prefix="/api")
 app.include_router(users.router, prefix="/api")
 
+# Compress larger responses such as contact lists
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Configure CORS (Cross-Origin Resource Sharing)
 origins = ["http://localhost:8000"]
 app.add_middleware(
@@ -34,6 +60,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[contacts.NEXT_CURSOR_HEADER],
 )
 
 @app.exception_handler(RateLimitExceeded)
@@ -46,9 +73,9 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
         exc (RateLimitExceeded): The exception containing rate limit details.
 
     Returns:
-        JSONResponse: A response with status code 429 and an error message.
+        ORJSONResponse: A response with status code 429 and an error message.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
         content={
             "error": f"Rate limit exceeded ({exc.detail}). Please try again later."
@@ -74,6 +101,16 @@ if __name__ == "__main__":
     """
     Runs the FastAPI application using Uvicorn.
     """
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True, workers=1)
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        reload=True,
+        workers=1,
+        # uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level="warning",
+    )
 
 
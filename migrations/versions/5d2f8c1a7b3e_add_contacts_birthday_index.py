@@ -0,0 +1,34 @@
+"""add contacts birthday index
+
+Revision ID: 5d2f8c1a7b3e
+Revises: 04ebb516b1cc
+Create Date: 2025-02-12 19:04:11.532817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8c1a7b3e'
+down_revision: Union[str, None] = '04ebb516b1cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Індекс по (user_id, місяць * 100 + день) для пошуку найближчих днів народження
+    op.create_index(
+        'ix_contacts_user_birthday_md',
+        'contacts',
+        [
+            'user_id',
+            sa.text('(EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday))'),
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_birthday_md', table_name='contacts')
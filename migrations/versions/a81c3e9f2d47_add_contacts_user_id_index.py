@@ -0,0 +1,26 @@
+"""add contacts user_id index
+
+Revision ID: a81c3e9f2d47
+Revises: 5d2f8c1a7b3e
+Create Date: 2025-02-13 18:42:37.104256
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a81c3e9f2d47'
+down_revision: Union[str, None] = '5d2f8c1a7b3e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_contacts_user_id'), 'contacts', ['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_contacts_user_id'), table_name='contacts')
@@ -0,0 +1,33 @@
+"""add contacts search trgm index
+
+Revision ID: c3b7d1e5a902
+Revises: a81c3e9f2d47
+Create Date: 2025-02-14 20:15:52.648193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3b7d1e5a902'
+down_revision: Union[str, None] = 'a81c3e9f2d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Вираз має збігатися з CONTACT_SEARCH_TEXT у src/repository/contacts.py
+    op.execute(
+        "CREATE INDEX ix_contacts_search_trgm ON contacts USING gin ("
+        "(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+        "coalesce(email, '') || ' ' || coalesce(phone_number, '') || ' ' || "
+        "coalesce(additional_data, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_search_trgm', table_name='contacts')
@@ -0,0 +1,29 @@
+"""add contacts user_id id index
+
+Revision ID: e6f4a2b8c193
+Revises: c3b7d1e5a902
+Create Date: 2025-02-16 17:27:09.381542
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f4a2b8c193'
+down_revision: Union[str, None] = 'c3b7d1e5a902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Складений індекс також обслуговує пошук лише за user_id
+    op.create_index('ix_contacts_user_id_id', 'contacts', ['user_id', 'id'])
+    op.drop_index(op.f('ix_contacts_user_id'), table_name='contacts')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_contacts_user_id'), 'contacts', ['user_id'])
+    op.drop_index('ix_contacts_user_id_id', table_name='contacts')
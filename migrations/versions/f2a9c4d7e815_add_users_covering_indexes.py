@@ -0,0 +1,44 @@
+"""add users covering indexes
+
+Revision ID: f2a9c4d7e815
+Revises: e6f4a2b8c193
+Create Date: 2025-02-18 18:42:37.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9c4d7e815'
+down_revision: Union[str, None] = 'e6f4a2b8c193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_COVERED_COLUMNS = [
+    'id', 'hashed_password', 'created_at', 'updated_at', 'avatar', 'confirmed', 'role',
+]
+
+
+def upgrade() -> None:
+    # Унікальні індекси з INCLUDE замінюють обмеження unique,
+    # тож пошук користувача виконується лише за індексом
+    op.create_index(
+        'ix_users_username', 'users', ['username'],
+        unique=True, postgresql_include=USER_COVERED_COLUMNS + ['email'],
+    )
+    op.create_index(
+        'ix_users_email', 'users', ['email'],
+        unique=True, postgresql_include=USER_COVERED_COLUMNS + ['username'],
+    )
+    op.drop_constraint('users_username_key', 'users', type_='unique')
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+    op.create_unique_constraint('users_username_key', 'users', ['username'])
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_index('ix_users_username', table_name='users')
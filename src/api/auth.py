@@ -15,13 +15,21 @@ from fastapi import (
     status,
 )
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
 
-from src.database.db import get_db
 from src.schemas.users import RequestEmail, Token, User, UserCreate, UserLogin, ResetPasswordRequest
-from src.services.auth import Hash, create_access_token, get_email_from_token
+from src.services.auth import (
+    Hash,
+    create_access_token,
+    get_email_from_token,
+    run_hashing,
+)
+from src.services.cache import (
+    acquire_email_cooldown,
+    get_user_by_email_cached,
+    invalidate_user,
+)
 from src.services.email import send_email
-from src.services.users import UserService
+from src.services.users import UserService, get_user_service
 from src.conf import messages
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -31,7 +39,7 @@ async def register_user(
     user_data: UserCreate,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: Session = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
     Registers a new user and sends a confirmation email.
@@ -40,58 +48,62 @@ async def register_user(
         user_data (UserCreate): The user registration data.
         background_tasks (BackgroundTasks): Background task handler for sending emails.
         request (Request): The request object to get base URL.
-        db (Session): The database session dependency.
+        user_service (UserService): The user service dependency.
     
     Returns:
         User: The newly created user object.
     """
-    user_service = UserService(db)
-
-    email_user = await user_service.get_user_by_email(user_data.email)
-    if email_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=messages.API_ERROR_USER_ALREADY_EXIST,
-        )
-
-    username_user = await user_service.get_user_by_username(user_data.username)
-    if username_user:
+    existing_user = await user_service.get_user_by_email_or_username(
+        user_data.email, user_data.username
+    )
+    if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=messages.API_ERROR_USER_ALREADY_EXIST,
         )
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await run_hashing(
+        Hash().get_password_hash, user_data.password
+    )
     new_user = await user_service.create_user(user_data)
     background_tasks.add_task(
         send_email, new_user.email, new_user.username, request.base_url
     )
-    return new_user
+    return User.from_orm_fast(new_user)
 
 @router.post("/login", response_model=Token)
-async def login_user(body: UserLogin, db: Session = Depends(get_db)):
+async def login_user(body: UserLogin, user_service: UserService = Depends(get_user_service)):
     """
     Authenticates a user and returns an access token.
     
     Args:
         body (UserLogin): The user login credentials.
-        db (Session): The database session dependency.
+        user_service (UserService): The user service dependency.
     
     Returns:
         Token: An access token for the authenticated user.
     """
-    user_service = UserService(db)
     user = await user_service.get_user_by_email(body.email)
     if user and not user.confirmed:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=messages.API_ERROR_USER_NOT_AUTHORIZED,
         )
-    if not user or not Hash().verify_password(body.password, user.hashed_password):
+    verified, new_hash = (
+        await run_hashing(
+            Hash().verify_and_update, body.password, user.hashed_password
+        )
+        if user
+        else (False, None)
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=messages.API_ERROR_WRONG_LOGIN_PASSWORD,
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        await user_service.update_user(user.id, {"hashed_password": new_hash})
+        await invalidate_user(user)
 
     access_token = await create_access_token(data={"sub": user.username})
     return {"access_token": access_token, "token_type": "bearer"}
@@ -101,7 +113,7 @@ async def request_email(
     body: RequestEmail,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: Session = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
     Requests email verification for an existing user.
@@ -110,37 +122,37 @@ async def request_email(
         body (RequestEmail): The email request payload.
         background_tasks (BackgroundTasks): Background task handler for sending emails.
         request (Request): The request object to get base URL.
-        db (Session): The database session dependency.
+        user_service (UserService): The user service dependency.
     
     Returns:
         dict: A message indicating the status of email verification.
     """
-    user_service = UserService(db)
-    user = await user_service.get_user_by_email(body.email)
+    user = await get_user_by_email_cached(user_service, body.email)
 
+    if user is None:
+        return {"message": "Check your email for confirmation"}
     if user.confirmed:
         return {"message": messages.API_EMAIL_CONFIRMED}
-    if user:
+    if await acquire_email_cooldown("confirm", user.email):
         background_tasks.add_task(
             send_email, user.email, user.username, request.base_url
         )
     return {"message": "Check your email for confirmation"}
 
 @router.get("/confirmed_email/{token}")
-async def confirmed_email(token: str, db: Session = Depends(get_db)):
+async def confirmed_email(token: str, user_service: UserService = Depends(get_user_service)):
     """
     Confirms the user's email using a token.
     
     Args:
         token (str): The email confirmation token.
-        db (Session): The database session dependency.
+        user_service (UserService): The user service dependency.
     
     Returns:
         dict: A message indicating whether the email confirmation was successful.
     """
     email = await get_email_from_token(token)
-    user_service = UserService(db)
-    user = await user_service.get_user_by_email(email)
+    user = await get_user_by_email_cached(user_service, email)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Verification error"
@@ -148,25 +160,25 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
     if user.confirmed:
         return {"message": messages.API_EMAIL_CONFIRMED}
     await user_service.confirmed_email(email)
+    await invalidate_user(user)
     return {"message": "Email successfully confirmed"}
 
 
 @router.post("/reset_password")
-async def reset_password(body: RequestEmail, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
+async def reset_password(body: RequestEmail, background_tasks: BackgroundTasks, request: Request, user_service: UserService = Depends(get_user_service)):
     """
     Requests a password reset for an existing user.
     
     Args:
         body (RequestEmail): The email request payload.
-        db (Session): The database session dependency.
+        user_service (UserService): The user service dependency.
     
     Returns:
         dict: A message indicating the status of the password reset request.
     """
-    user_service = UserService(db)
-    user = await user_service.get_user_by_email(body.email)
+    user = await get_user_by_email_cached(user_service, body.email)
 
-    if user:
+    if user and await acquire_email_cooldown("reset", user.email):
         background_tasks.add_task(
             send_email, user.email, user.username, request.base_url
         )
@@ -174,27 +186,27 @@ async def reset_password(body: RequestEmail, background_tasks: BackgroundTasks,
 
 
 @router.patch("/update_password/{token}")
-async def update_password(token: str, body: ResetPasswordRequest, db: Session = Depends(get_db)):
+async def update_password(token: str, body: ResetPasswordRequest, user_service: UserService = Depends(get_user_service)):
     """
     Updates the user's password using a token.
     
     Args:
         token (str): The password reset token.
         body (UserCreate): The new password payload.
-        db (Session): The database session dependency.
+        user_service (UserService): The user service dependency.
     
     Returns:
         dict: A message indicating whether the password reset was successful.
     """
     email = await get_email_from_token(token)
-    user_service = UserService(db)
-    user = await user_service.get_user_by_email(email)
+    user = await get_user_by_email_cached(user_service, email)
 
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired token."
         )
 
-    hashed_password = Hash().get_password_hash(body.password)
+    hashed_password = await run_hashing(Hash().get_password_hash, body.password)
     await user_service.update_user(user.id, {"hashed_password": hashed_password})
+    await invalidate_user(user)
     return {"message": "Password has been successfully reset."}
\ No newline at end of file
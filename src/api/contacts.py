@@ -2,50 +2,97 @@
 This module defines routes for managing user contacts.
 
 It includes endpoints for creating, reading, updating, and deleting contacts,
-searching for contacts, and retrieving upcoming birthdays.
+searching for contacts, exporting them, and retrieving upcoming birthdays.
 """
 
-from typing import List
+from typing import Annotated, AsyncContextManager, Callable, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.conf import messages
-from src.database.db import get_db
+from src.database.db import get_session_factory
 from src.database.models import User
 from src.schemas.contacts import ContactBase, ContactBirthdayRequest, ContactResponse
 from src.services.auth import get_current_user
-from src.services.contacts import ContactService
+from src.services.contacts import ContactService, get_contact_service
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+# Upper bound for one bulk insert, so a single request cannot hold
+# a transaction and a pool connection for too long.
+MAX_BULK_CONTACTS = 1000
+
 @router.get("/", response_model=List[ContactResponse], status_code=status.HTTP_200_OK)
 async def read_contacts(
-    skip: int = 0,
+    response: Response,
+    after_id: int | None = None,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
-    Retrieves a list of contacts for the authenticated user.
+    Retrieves a page of contacts for the authenticated user.
+
+    When the page is full, the ``X-Next-Cursor`` response header holds the
+    value to pass as ``after_id`` to get the next page.
     
     Args:
-        skip (int): Number of contacts to skip.
+        response (Response): The response, used to set the cursor header.
+        after_id (int | None): Return contacts with an ID greater than this.
         limit (int): Maximum number of contacts to return.
-        db (AsyncSession): Database session dependency.
+        contact_service (ContactService): Contact service dependency.
         user (User): The authenticated user.
     
     Returns:
         List[ContactResponse]: A list of contacts.
     """
-    contact_service = ContactService(db)
-    contacts = await contact_service.get_contacts(skip, limit, user)
+    contacts = await contact_service.get_contacts(after_id, limit, user)
+    if contacts and len(contacts) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(contacts[-1].id)
     return contacts
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_contacts(
+    session_factory: Callable[[], AsyncContextManager[AsyncSession]] = Depends(
+        get_session_factory
+    ),
+    user: User = Depends(get_current_user),
+):
+    """
+    Exports all contacts of the authenticated user as a JSON array.
+
+    The array is streamed row by row, so memory use does not depend
+    on the number of contacts.
+    
+    Args:
+        session_factory (Callable): Opens the session the export reads from.
+        user (User): The authenticated user.
+    
+    Returns:
+        StreamingResponse: The contacts as a JSON array.
+    """
+
+    async def generate():
+        # Dependencies with yield are closed before a streamed body is sent,
+        # so the export reads through a session of its own.
+        async with session_factory() as db:
+            yield b"["
+            separator = b""
+            async for contact in ContactService(db).stream_contacts(user):
+                yield separator + orjson.dumps(dict(contact))
+                separator = b","
+            yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def read_contact(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -53,13 +100,12 @@ async def read_contact(
     
     Args:
         contact_id (int): ID of the contact to retrieve.
-        db (AsyncSession): Database session dependency.
+        contact_service (ContactService): Contact service dependency.
         user (User): The authenticated user.
     
     Returns:
         ContactResponse: The requested contact.
     """
-    contact_service = ContactService(db)
     contact = await contact_service.get_contact(contact_id, user)
     if contact is None:
         raise HTTPException(
@@ -70,7 +116,7 @@ async def read_contact(
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
     body: ContactBase,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -78,20 +124,43 @@ async def create_contact(
     
     Args:
         body (ContactBase): Contact data.
-        db (AsyncSession): Database session dependency.
+        contact_service (ContactService): Contact service dependency.
         user (User): The authenticated user.
     
     Returns:
         ContactResponse: The created contact.
     """
-    contact_service = ContactService(db)
     return await contact_service.create_contact(body, user)
 
+@router.post(
+    "/bulk", response_model=List[ContactResponse], status_code=status.HTTP_201_CREATED
+)
+async def create_contacts(
+    body: Annotated[
+        List[ContactBase], Body(min_length=1, max_length=MAX_BULK_CONTACTS)
+    ],
+    contact_service: ContactService = Depends(get_contact_service),
+    user: User = Depends(get_current_user),
+):
+    """
+    Creates several contacts for the authenticated user in one transaction.
+    
+    Args:
+        body (List[ContactBase]): Data of the contacts to create,
+            from 1 to ``MAX_BULK_CONTACTS`` items.
+        contact_service (ContactService): Contact service dependency.
+        user (User): The authenticated user.
+    
+    Returns:
+        List[ContactResponse]: The created contacts.
+    """
+    return await contact_service.create_contacts(body, user)
+
 @router.put("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
     body: ContactBase,
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -100,13 +169,12 @@ async def update_contact(
     Args:
         body (ContactBase): Updated contact data.
         contact_id (int): ID of the contact to update.
-        db (AsyncSession): Database session dependency.
+        contact_service (ContactService): Contact service dependency.
         user (User): The authenticated user.
     
     Returns:
         ContactResponse: The updated contact.
     """
-    contact_service = ContactService(db)
     contact = await contact_service.update_contact(contact_id, body, user)
     if contact is None:
         raise HTTPException(
@@ -117,7 +185,7 @@ async def update_contact(
 @router.delete("/{contact_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_contact(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -125,12 +193,11 @@ async def remove_contact(
     
     Args:
         contact_id (int): ID of the contact to delete.
-        db (AsyncSession): Database session dependency.
+        contact_service (ContactService): Contact service dependency.
         user (User): The authenticated user.
     """
-    contact_service = ContactService(db)
-    contact = await contact_service.remove_contact(contact_id, user)
-    if contact is None:
+    deleted_id = await contact_service.remove_contact(contact_id, user)
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=messages.CONTACT_NOT_FOUND
         )
@@ -139,32 +206,38 @@ async def remove_contact(
 @router.get("/search/", response_model=List[ContactResponse])
 async def search_contacts(
     text: str,
-    skip: int = 0,
+    response: Response,
+    after_id: int | None = None,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
     Searches contacts by name or other fields.
+
+    Pages work as in ``read_contacts``: when the page is full, the
+    ``X-Next-Cursor`` response header holds the next ``after_id``.
     
     Args:
         text (str): Search query.
-        skip (int): Number of contacts to skip.
+        response (Response): The response, used to set the cursor header.
+        after_id (int | None): Return contacts with an ID greater than this.
         limit (int): Maximum number of contacts to return.
-        db (AsyncSession): Database session dependency.
+        contact_service (ContactService): Contact service dependency.
         user (User): The authenticated user.
     
     Returns:
         List[ContactResponse]: A list of matching contacts.
     """
-    contact_service = ContactService(db)
-    contacts = await contact_service.search_contacts(text, skip, limit, user)
+    contacts = await contact_service.search_contacts(text, after_id, limit, user)
+    if contacts and len(contacts) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(contacts[-1].id)
     return contacts
 
 @router.post("/upcoming-birthdays", response_model=List[ContactResponse])
 async def upcoming_birthdays(
     body: ContactBirthdayRequest,
-    db: AsyncSession = Depends(get_db),
+    contact_service: ContactService = Depends(get_contact_service),
     user: User = Depends(get_current_user),
 ):
     """
@@ -172,12 +245,11 @@ async def upcoming_birthdays(
     
     Args:
         body (ContactBirthdayRequest): Number of days to check for upcoming birthdays.
-        db (AsyncSession): Database session dependency.
+        contact_service (ContactService): Contact service dependency.
         user (User): The authenticated user.
     
     Returns:
         List[ContactResponse]: A list of contacts with upcoming birthdays.
     """
-    contact_service = ContactService(db)
-    contacts = await contact_service.upcoming_birthdays(body.days, user)
+    contacts = await contact_service.get_upcoming_birthdays(body.days, user)
     return contacts
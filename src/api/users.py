@@ -1,14 +1,13 @@
 from fastapi import APIRouter, Depends, File, Request, UploadFile
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.conf.config import settings
-from src.database.db import get_db
 from src.schemas.users import User
 from src.services.auth import get_current_user
+from src.services.cache import invalidate_user
 from src.services.upload_file import UploadFileService
-from src.services.users import UserService
+from src.services.users import UserService, get_user_service
 
 limiter = Limiter(key_func=get_remote_address)
 
@@ -18,20 +17,20 @@ router = APIRouter(prefix="/users", tags=["users"])
 @router.get("/me", response_model=User)
 @limiter.limit("5/minute")
 async def me(request: Request, user: User = Depends(get_current_user)):
-    return user
+    return User.from_orm_fast(user)
 
 
 @router.patch("/avatar", response_model=User)
 async def update_avatar_user(
     file: UploadFile = File(),
     user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     avatar_url = UploadFileService(
         settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
     ).upload_file(file, user.username)
 
-    user_service = UserService(db)
     user = await user_service.update_avatar_url(user.email, avatar_url)
+    await invalidate_user(user)
 
-    return user
\ No newline at end of file
+    return User.from_orm_fast(user)
\ No newline at end of file
@@ -5,6 +5,8 @@ It includes endpoints for creating, reading, updating, and deleting contacts,
 searching for contacts, retrieving upcoming birthdays, and checking database health.
 """
 
+import time
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +16,11 @@ from src.database.db import get_db
 
 router = APIRouter(tags=["utils"])
 
+# A healthy result is reused for a short while so frequent probes
+# do not compete with real requests for pool connections.
+HEALTH_CACHE_SECONDS = 2
+_health_cache = {"ok": False, "ts": 0.0}
+
 @router.get("/healthchecker")
 async def healthchecker(db: AsyncSession = Depends(get_db)):
     """
@@ -28,18 +35,25 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If the database connection is not configured correctly or an error occurs.
     """
+    if (
+        _health_cache["ok"]
+        and time.monotonic() - _health_cache["ts"] < HEALTH_CACHE_SECONDS
+    ):
+        return {"message": messages.HEALTHCHECKER_MESSAGE}
+
     try:
         # Execute an asynchronous query
-        result = await db.execute(text("SELECT 1"))
-        result = result.scalar_one_or_none()
+        result = (await db.execute(text("SELECT 1"))).scalar_one_or_none()
 
         if result is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database is not configured correctly",
             )
+        _health_cache.update(ok=True, ts=time.monotonic())
         return {"message": messages.HEALTHCHECKER_MESSAGE}
     except Exception as e:
+        _health_cache["ok"] = False
         print(e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -6,6 +6,10 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DB_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_RECYCLE: int = 1800
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
@@ -26,6 +30,12 @@ class Settings(BaseSettings):
     CLD_API_KEY: int
     CLD_API_SECRET: str
 
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_PASSWORD: str | None = None
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 0.5
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+
     model_config = ConfigDict(
         extra="ignore", env_file=".env", env_file_encoding="utf-8", case_sensitive=True
     )
@@ -1,7 +1,16 @@
+import asyncio
 import contextlib
+from typing import AsyncContextManager, AsyncIterator, Callable
 
+from sqlalchemy import make_url, text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.conf.config import settings
 
@@ -9,13 +18,53 @@ from src.conf.config import settings
 class DatabaseSessionManager:
 
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        connect_args = {}
+        if make_url(url).get_driver_name() == "asyncpg":
+            # JIT compilation only slows down the short queries of this app
+            connect_args["server_settings"] = {"jit": "off"}
+            # Room for every statement of the app on each connection
+            connect_args["prepared_statement_cache_size"] = 1024
+
+        self._engine: AsyncEngine | None = create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+            # Room for every lambda_stmt variant next to the ad-hoc queries.
+            query_cache_size=1200,
+            connect_args=connect_args,
+        )
+        # Objects returned by INSERT/UPDATE ... RETURNING must stay readable
+        # after commit, without a lazy refresh outside the event loop.
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False, autocommit=False, expire_on_commit=False, bind=self._engine
         )
 
+    async def warm_up(self, connections: int) -> None:
+        """
+        Opens pool connections ahead of the first requests.
+
+        The connections are checked out concurrently, so the pool has to
+        create that many of them, and each runs one query to finish its setup.
+        """
+        if self._engine is None:
+            raise RuntimeError("Database engine is not initialized")
+
+        async def ping():
+            async with self._engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(ping() for _ in range(connections)))
+
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+
     @contextlib.asynccontextmanager
-    async def session(self):
+    async def session(self) -> AsyncIterator[AsyncSession]:
         if self._session_maker is None:
             raise RuntimeError("Database session is not initialized")
         session = self._session_maker()
@@ -31,6 +80,10 @@ class DatabaseSessionManager:
 sessionmanager = DatabaseSessionManager(settings.DB_URL)
 
 
-async def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     async with sessionmanager.session() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+def get_session_factory() -> Callable[[], AsyncContextManager[AsyncSession]]:
+    return sessionmanager.session
@@ -8,7 +8,7 @@ from datetime import date, datetime
 from enum import Enum
 
 from sqlalchemy import Column, Integer, String, Enum as SqlEnum
-from sqlalchemy import Boolean, Column, Integer, String, Table, func
+from sqlalchemy import Boolean, Column, Index, Integer, String, Table, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql.schema import ForeignKey, PrimaryKeyConstraint
 from sqlalchemy.sql.sqltypes import Date, DateTime
@@ -46,6 +46,27 @@ class Contact(Base):
         user (User): Relationship to the User model.
     """
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        # PostgreSQL-only expression indexes, created by migrations
+        # 5d2f8c1a7b3e and c3b7d1e5a902; declared here so autogenerate
+        # does not drop them.
+        Index(
+            "ix_contacts_user_birthday_md",
+            "user_id",
+            text("(EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday))"),
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_contacts_search_trgm",
+            # Must match CONTACT_SEARCH_TEXT in src/repository/contacts.py
+            text(
+                "(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || "
+                "coalesce(email, '') || ' ' || coalesce(phone_number, '') || ' ' || "
+                "coalesce(additional_data, '')) gin_trgm_ops"
+            ),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     first_name: Mapped[str] = mapped_column(String(50), nullable=False)
     last_name: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -56,7 +77,21 @@ class Contact(Base):
     user_id = Column(
         "user_id", ForeignKey("users.id", ondelete="CASCADE"), default=None
     )
-    user = relationship("User", backref="contacts")
+    # Never loaded implicitly: queries that need the owner must load it eagerly.
+    user: Mapped["User"] = relationship(
+        "User", back_populates="contacts", lazy="raise_on_sql"
+    )
+
+# Columns stored in the users lookup indexes besides their key column.
+USER_COVERED_COLUMNS = [
+    "id",
+    "hashed_password",
+    "created_at",
+    "updated_at",
+    "avatar",
+    "confirmed",
+    "role",
+]
 
 class User(Base):
     """
@@ -70,13 +105,30 @@ class User(Base):
         created_at (datetime): Timestamp of user creation.
         avatar (str, optional): URL or path to the user's avatar image.
         confirmed (bool): Indicates whether the user has confirmed their email.
+        contacts (list[Contact]): Relationship to the user's contacts.
     """
     __tablename__ = "users"
+    # Unique lookups on the auth path are served by index-only scans.
+    __table_args__ = (
+        Index(
+            "ix_users_username",
+            "username",
+            unique=True,
+            postgresql_include=USER_COVERED_COLUMNS + ["email"],
+        ),
+        Index(
+            "ix_users_email",
+            "email",
+            unique=True,
+            postgresql_include=USER_COVERED_COLUMNS + ["username"],
+        ),
+    )
     id = Column(Integer, primary_key=True)
-    username = Column(String, unique=True)
-    email = Column(String, unique=True)
+    username = Column(String)
+    email = Column(String)
     hashed_password = Column(String)
     created_at = Column(DateTime, default=func.now())
     avatar = Column(String(255), nullable=True)
     confirmed = Column(Boolean, default=False)
     role = Column(SqlEnum(UserRole), default=UserRole.USER, nullable=False)
+    contacts = relationship("Contact", back_populates="user")
@@ -5,19 +5,72 @@ It includes methods for creating, retrieving, updating, deleting, searching,
 and retrieving upcoming birthdays of contacts associated with a user.
 """
 
-from typing import List
+from typing import AsyncIterator, List
 
-from sqlalchemy import Integer, select, or_, and_, func, extract
+from sqlalchemy import (
+    RowMapping,
+    Integer,
+    select,
+    insert,
+    delete,
+    update,
+    or_,
+    func,
+    extract,
+    lambda_stmt,
+    literal_column,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from datetime import timedelta
+from datetime import date, timedelta
 
 from src.database.models import Contact, User
 from src.schemas.contacts import ContactResponse, ContactBase
 
+# Columns needed to build a ContactResponse.
+CONTACT_RESPONSE_COLUMNS = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone_number,
+    Contact.birthday,
+    Contact.additional_data,
+    Contact.created_at,
+    Contact.updated_at,
+)
+
+# Searchable contact fields joined into one string. Must match the
+# ix_contacts_search_trgm index expression, so the separator literals are
+# rendered inline instead of as bound parameters.
+_EMPTY = literal_column("''")
+_SPACE = literal_column("' '")
+CONTACT_SEARCH_TEXT = (
+    func.coalesce(Contact.first_name, _EMPTY)
+    + _SPACE
+    + func.coalesce(Contact.last_name, _EMPTY)
+    + _SPACE
+    + func.coalesce(Contact.email, _EMPTY)
+    + _SPACE
+    + func.coalesce(Contact.phone_number, _EMPTY)
+    + _SPACE
+    + func.coalesce(Contact.additional_data, _EMPTY)
+)
+
+# Birthday as month * 100 + day. Must match the ix_contacts_user_birthday_md
+# index expression, so the multiplier is rendered inline instead of as a
+# bound parameter.
+BIRTHDAY_MD = extract("month", Contact.birthday) * literal_column("100") + extract(
+    "day", Contact.birthday
+)
+
 class ContactRepository:
     """
     Repository for managing contact-related database operations.
+
+    The hot read queries are built with ``lambda_stmt``, so their SQL is
+    constructed and compiled once per call site and only the bound values
+    change between calls.
     """
     def __init__(self, session: AsyncSession):
         """
@@ -28,21 +81,55 @@ class ContactRepository:
         """
         self.db = session
 
-    async def get_contacts(self, skip: int, limit: int, user: User) -> List[Contact]:
+    async def get_contacts(
+        self, after_id: int | None, limit: int, user: User
+    ) -> List[RowMapping]:
         """
-        Retrieves a list of contacts for a given user.
+        Retrieves a page of contacts for a given user, ordered by ID.
+
+        Pages are addressed by the last seen ID (keyset pagination), so deep
+        pages cost the same as the first one. Only the columns exposed by the
+        API are selected and rows are returned as mappings, so no ORM instances
+        are built for this read-only listing.
         
         Args:
-            skip (int): Number of contacts to skip.
+            after_id (int | None): Return contacts with an ID greater than this.
             limit (int): Maximum number of contacts to return.
             user (User): The authenticated user.
         
         Returns:
-            List[Contact]: A list of contacts.
+            List[RowMapping]: A list of contact rows.
         """
-        stmt = select(Contact).filter_by(user=user).offset(skip).limit(limit)
+        user_id, after_id = user.id, after_id or 0
+        stmt = lambda_stmt(lambda: select(*CONTACT_RESPONSE_COLUMNS))
+        stmt += lambda s: s.where(
+            Contact.user_id == user_id, Contact.id > after_id
+        ).order_by(Contact.id).limit(limit)
         contacts = await self.db.execute(stmt)
-        return contacts.scalars().all()
+        return contacts.mappings().all()
+
+    async def stream_contacts(self, user: User) -> AsyncIterator[RowMapping]:
+        """
+        Yields all contacts of a user, ordered by ID, without loading them at once.
+
+        Rows are fetched from a server-side cursor in batches, so memory use
+        does not grow with the number of contacts.
+        
+        Args:
+            user (User): The authenticated user.
+        
+        Yields:
+            RowMapping: The next contact row.
+        """
+        stmt = (
+            select(*CONTACT_RESPONSE_COLUMNS)
+            .where(Contact.user_id == user.id)
+            .order_by(Contact.id)
+            .execution_options(yield_per=500)
+        )
+        contacts = await self.db.stream(stmt)
+        async for contact in contacts.mappings():
+            yield contact
 
     async def get_contacts_by_id(self, contact_id: int, user: User) -> Contact | None:
         """
@@ -55,7 +142,9 @@ class ContactRepository:
         Returns:
             Contact | None: The contact object if found, otherwise None.
         """
-        stmt = select(Contact).filter_by(user=user, id=contact_id)
+        user_id = user.id
+        stmt = lambda_stmt(lambda: select(Contact))
+        stmt += lambda s: s.where(Contact.user_id == user_id, Contact.id == contact_id)
         contact = await self.db.execute(stmt)
         return contact.scalar_one_or_none()
 
@@ -70,13 +159,43 @@ class ContactRepository:
         Returns:
             Contact: The created contact.
         """
-        contact = Contact(**body.model_dump(exclude_unset=True), user=user)
-        self.db.add(contact)
+        stmt = (
+            insert(Contact)
+            .values(**body.model_dump(exclude_unset=True), user_id=user.id)
+            .returning(Contact)
+        )
+        contact = (await self.db.execute(stmt)).scalar_one()
         await self.db.commit()
-        await self.db.refresh(contact)
         return contact
 
-    async def remove_contact(self, contact_id: int, user: User) -> Contact | None:
+    async def create_contacts(
+        self, bodies: List[ContactBase], user: User
+    ) -> List[Contact]:
+        """
+        Creates several contacts for the user with one statement and one commit.
+        
+        Args:
+            bodies (List[ContactBase]): The data of each contact.
+            user (User): The authenticated user.
+        
+        Returns:
+            List[Contact]: The created contacts, in the order of ``bodies``.
+        """
+        if not bodies:
+            return []
+        stmt = insert(Contact).returning(Contact, sort_by_parameter_order=True)
+        contacts = await self.db.scalars(
+            stmt,
+            [
+                {**body.model_dump(exclude_unset=True), "user_id": user.id}
+                for body in bodies
+            ],
+        )
+        contacts = contacts.all()
+        await self.db.commit()
+        return contacts
+
+    async def remove_contact(self, contact_id: int, user: User) -> int | None:
         """
         Deletes a contact by ID.
         
@@ -85,13 +204,16 @@ class ContactRepository:
             user (User): The authenticated user.
         
         Returns:
-            Contact | None: The deleted contact if found, otherwise None.
+            int | None: The ID of the deleted contact if found, otherwise None.
         """
-        contact = await self.get_contacts_by_id(contact_id, user)
-        if contact:
-            await self.db.delete(contact)
-            await self.db.commit()
-        return contact
+        stmt = (
+            delete(Contact)
+            .where(Contact.user_id == user.id, Contact.id == contact_id)
+            .returning(Contact.id)
+        )
+        deleted_id = (await self.db.execute(stmt)).scalar_one_or_none()
+        await self.db.commit()
+        return deleted_id
 
     async def update_contact(
         self, contact_id: int, body: ContactBase, user: User
@@ -107,77 +229,76 @@ class ContactRepository:
         Returns:
             Contact | None: The updated contact if found, otherwise None.
         """
-        contact = await self.get_contacts_by_id(contact_id, user)
-        if contact:
-            for key, value in body.model_dump(exclude_unset=True).items():
-                setattr(contact, key, value)
-
-            await self.db.commit()
-            await self.db.refresh(contact)
-
+        stmt = (
+            update(Contact)
+            .where(Contact.user_id == user.id, Contact.id == contact_id)
+            .values(**body.model_dump(exclude_unset=True))
+            .returning(Contact)
+        )
+        contact = (await self.db.execute(stmt)).scalar_one_or_none()
+        await self.db.commit()
         return contact
 
     async def search_contacts(
-        self, search: str, skip: int, limit: int, user: User
-    ) -> List[Contact]:
+        self, search: str, after_id: int | None, limit: int, user: User
+    ) -> List[RowMapping]:
         """
-        Searches for contacts based on various fields.
+        Searches for a page of contacts based on various fields, ordered by ID.
+
+        Like ``get_contacts``, pages are addressed by the last seen ID and only
+        the columns exposed by the API are selected.
         
         Args:
             search (str): The search query.
-            skip (int): Number of contacts to skip.
+            after_id (int | None): Return contacts with an ID greater than this.
             limit (int): Maximum number of contacts to return.
             user (User): The authenticated user.
         
         Returns:
-            List[Contact]: A list of matching contacts.
+            List[RowMapping]: A list of matching contact rows.
         """
-        stmt = (
-            select(Contact)
-            .filter(
-                Contact.user == user,
-                or_(
-                    Contact.first_name.ilike(f"%{search}%"),
-                    Contact.last_name.ilike(f"%{search}%"),
-                    Contact.email.ilike(f"%{search}%"),
-                    Contact.phone_number.ilike(f"%{search}%"),
-                    Contact.additional_data.ilike(f"%{search}%"),
-                )
-            )
-            .offset(skip)
-            .limit(limit)
-        )
+        user_id, after_id, pattern = user.id, after_id or 0, f"%{search}%"
+        stmt = lambda_stmt(lambda: select(*CONTACT_RESPONSE_COLUMNS))
+        stmt += lambda s: s.where(
+            Contact.user_id == user_id,
+            Contact.id > after_id,
+            CONTACT_SEARCH_TEXT.ilike(pattern),
+        ).order_by(Contact.id).limit(limit)
         contacts = await self.db.execute(stmt)
-        return contacts.scalars().all()
+        return contacts.mappings().all()
 
-    async def get_upcoming_birthdays(self, days: int, user: User) -> List[Contact]:
+    async def get_upcoming_birthdays(
+        self, days: int, user: User
+    ) -> List[RowMapping]:
         """
         Retrieves contacts with upcoming birthdays within a given number of days.
+
+        Like ``get_contacts``, only the columns exposed by the API are selected.
         
         Args:
             days (int): Number of days to check for upcoming birthdays.
             user (User): The authenticated user.
         
         Returns:
-            List[Contact]: A list of contacts with upcoming birthdays.
+            List[RowMapping]: A list of contact rows with upcoming birthdays.
         """
-        today = func.current_date()
+        today = date.today()
         future_date = today + timedelta(days=days)
-        stmt = select(Contact).filter(
-            Contact.user == user,
-            or_(
-                and_(
-                    func.to_char(Contact.birthday, "MM-DD") >= func.to_char(today, "MM-DD"),
-                    func.to_char(Contact.birthday, "MM-DD") <= func.to_char(future_date, "MM-DD")
-                ),
-                and_(
-                    func.to_char(today, "MM-DD") > func.to_char(future_date, "MM-DD"),
-                    or_(
-                        func.to_char(Contact.birthday, "MM-DD") >= func.to_char(today, "MM-DD"),
-                        func.to_char(Contact.birthday, "MM-DD") <= func.to_char(future_date, "MM-DD")
-                    )
-                )
-            )
+        today_md = today.month * 100 + today.day
+        future_md = future_date.month * 100 + future_date.day
+
+        # Each window shape has its own cached statement; the dates are bound.
+        user_id = user.id
+        stmt = lambda_stmt(
+            lambda: select(*CONTACT_RESPONSE_COLUMNS).where(Contact.user_id == user_id)
         )
+        if future_md < today_md:
+            # The window wraps around the new year.
+            stmt += lambda s: s.where(
+                or_(BIRTHDAY_MD >= today_md, BIRTHDAY_MD <= future_md)
+            )
+        elif future_date.year == today.year:
+            stmt += lambda s: s.where(BIRTHDAY_MD.between(today_md, future_md))
+        # Otherwise the window covers the whole year.
         contacts = await self.db.execute(stmt)
-        return contacts.scalars().all()
+        return contacts.mappings().all()
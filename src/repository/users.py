@@ -4,7 +4,7 @@ This module defines the repository layer for managing user-related database oper
 It includes methods for retrieving, creating, updating, and confirming users.
 """
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
@@ -13,6 +13,9 @@ from src.schemas.users import UserCreate
 class UserRepository:
     """
     Repository for managing user-related database operations.
+
+    Lookups run on every authenticated request, so they are built with
+    ``lambda_stmt`` and compiled once per call site.
     """
     def __init__(self, session: AsyncSession):
         """
@@ -33,7 +36,7 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(id=user_id)
+        stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -47,7 +50,7 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(username=username)
+        stmt = lambda_stmt(lambda: select(User).where(User.username == username))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -61,7 +64,28 @@ class UserRepository:
         Returns:
             User | None: The user object if found, otherwise None.
         """
-        stmt = select(User).filter_by(email=email)
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
+        user = await self.db.execute(stmt)
+        return user.scalar_one_or_none()
+
+    async def get_user_by_email_or_username(
+        self, email: str, username: str
+    ) -> User | None:
+        """
+        Retrieves a user that has either the given email or the given username.
+        
+        Args:
+            email (str): The email address to look for.
+            username (str): The username to look for.
+        
+        Returns:
+            User | None: The first matching user if found, otherwise None.
+        """
+        stmt = lambda_stmt(
+            lambda: select(User)
+            .where(or_(User.email == email, User.username == username))
+            .limit(1)
+        )
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -93,9 +117,31 @@ class UserRepository:
         Args:
             email (str): The email address of the user to confirm.
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
+        stmt = update(User).where(User.email == email).values(confirmed=True)
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+    async def update_user(self, user_id: int, data: dict) -> User | None:
+        """
+        Updates the given fields of a user.
+        
+        Args:
+            user_id (int): The ID of the user.
+            data (dict): The field names and their new values.
+        
+        Returns:
+            User | None: The updated user object if found, otherwise None.
+        """
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**data)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        user = (await self.db.execute(stmt)).scalar_one_or_none()
         await self.db.commit()
+        return user
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         """
@@ -108,8 +154,13 @@ class UserRepository:
         Returns:
             User: The updated user object.
         """
-        user = await self.get_user_by_email(email)
-        user.avatar = url
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(avatar=url)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        user = (await self.db.execute(stmt)).scalar_one()
         await self.db.commit()
-        await self.db.refresh(user)
         return user
@@ -0,0 +1,32 @@
+from collections.abc import Mapping
+from typing import Any, Self
+
+from pydantic import BaseModel
+
+
+class TrustedResponse(BaseModel):
+    """
+    Base for response schemas that are built from data read from the database.
+
+    Such data was validated on the way in, so ``from_orm_fast`` skips
+    validation and builds the model with ``model_construct``. FastAPI passes
+    model instances through the response model without validating them again.
+    Request schemas must keep using the regular validating constructors.
+    """
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> Self:
+        """
+        Builds the schema from an ORM object or a row mapping without validation.
+
+        Args:
+            obj (Any): An ORM instance or a row mapping with the schema fields.
+
+        Returns:
+            Self: The constructed schema.
+        """
+        if isinstance(obj, Mapping):
+            data = {name: obj[name] for name in cls.model_fields}
+        else:
+            data = {name: getattr(obj, name) for name in cls.model_fields}
+        return cls.model_construct(**data)
@@ -2,6 +2,8 @@ from datetime import date, datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict, EmailStr, field_validator
 
+from src.schemas.base import TrustedResponse
+
 
 
 class ContactBase(BaseModel):
@@ -18,7 +20,7 @@ class ContactBase(BaseModel):
             raise ValueError('Birthday cannot be in the future')
         return v
 
-class ContactResponse(ContactBase):
+class ContactResponse(ContactBase, TrustedResponse):
     id: int
     created_at: datetime | None
     updated_at: Optional[datetime] | None
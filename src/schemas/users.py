@@ -2,9 +2,10 @@ from datetime import date, datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict, EmailStr, field_validator
 from src.database.models import UserRole
+from src.schemas.base import TrustedResponse
 
 # Схема користувача
-class User(BaseModel):
+class User(TrustedResponse):
     id: int
     username: str
     email: str
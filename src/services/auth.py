@@ -5,34 +5,59 @@ It includes password hashing, JWT token generation, user authentication,
 and email verification token management.
 """
 
+import asyncio
+import functools
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, UTC
-from typing import Optional
-import redis
-from redis_lru import RedisLRU
+from typing import Any, Callable, Optional
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
+import bcrypt
+from cachetools import TTLCache
 
 from fastapi import Depends, HTTPException, status
-from passlib.context import CryptContext
 from fastapi.security import (
     HTTPBearer,
     HTTPAuthorizationCredentials,
 )
-from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+import jwt
 
-from src.database.db import get_db
 from src.conf.config import settings
-from src.services.users import UserService
+from src.services.cache import get_user_by_username_cached
+from src.services.users import UserService, get_user_service
 from src.database.models import User, UserRole
 
 
-client = redis.StrictRedis(host="localhost", port=6379, password=None)
-cache = RedisLRU(client, default_ttl=15 * 60)
+_JWT_KEY = settings.JWT_SECRET.encode()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+# Successful password verifications, keyed by the stored hash and a keyed
+# digest of the plain password, so repeated logins skip the slow hashing.
+_VERIFY_CACHE_SECRET = secrets.token_bytes(32)
+_verified_passwords = TTLCache(maxsize=4096, ttl=30)
+_verified_passwords_lock = threading.Lock()
+
+# Password hashing is CPU-bound, so it runs off the event loop.
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="password-hash"
+)
 
 class Hash:
     """
     Provides password hashing and verification methods.
     """
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # argon2id with the OWASP baseline cost; bcrypt is kept only to verify
+    # existing hashes, which are upgraded on the next successful login.
+    # Both libraries are called directly, without passlib's scheme dispatch.
+    password_hasher = PasswordHasher(
+        time_cost=2, memory_cost=19 * 1024, parallelism=1, type=Type.ID
+    )
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -45,11 +70,76 @@ class Hash:
         Returns:
             bool: True if passwords match, otherwise False.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        verified, _ = self.verify_and_update(plain_password, hashed_password)
+        return verified
+
+    def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        Verifies a password and rehashes it if the stored hash is outdated.
+        
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The hashed password.
+        
+        Returns:
+            tuple[bool, str | None]: Whether passwords match, and the new hash
+            to store if the old one uses a deprecated scheme or cost.
+        """
+        cache_key = (
+            hashed_password,
+            hmac.new(
+                _VERIFY_CACHE_SECRET, plain_password.encode(), hashlib.sha256
+            ).hexdigest(),
+        )
+        with _verified_passwords_lock:
+            if cache_key in _verified_passwords:
+                return True, None
+
+        verified, new_hash = self._verify(plain_password, hashed_password)
+        if verified:
+            with _verified_passwords_lock:
+                _verified_passwords[cache_key] = True
+        return verified, new_hash
+
+    def _verify(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        Verifies a password against an argon2 or legacy bcrypt hash.
+        
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The hashed password.
+        
+        Returns:
+            tuple[bool, str | None]: Whether passwords match, and the new hash
+            to store if the old one uses a deprecated scheme or cost.
+        """
+        if hashed_password.startswith("$argon2"):
+            try:
+                self.password_hasher.verify(hashed_password, plain_password)
+            except (VerificationError, InvalidHashError):
+                return False, None
+            if self.password_hasher.check_needs_rehash(hashed_password):
+                return True, self.get_password_hash(plain_password)
+            return True, None
+
+        if hashed_password.startswith("$2"):
+            try:
+                verified = bcrypt.checkpw(
+                    plain_password.encode(), hashed_password.encode()
+                )
+            except ValueError:
+                return False, None
+            if verified:
+                return True, self.get_password_hash(plain_password)
+        return False, None
 
     def get_password_hash(self, password: str) -> str:
         """
-        Hashes a password using bcrypt.
+        Hashes a password using argon2id.
         
         Args:
             password (str): The plain text password.
@@ -57,7 +147,25 @@ class Hash:
         Returns:
             str: The hashed password.
         """
-        return self.pwd_context.hash(password)
+        return self.password_hasher.hash(password)
+
+# Load the hashing backend at import instead of on the first request.
+Hash.password_hasher.hash("warmup")
+
+
+async def run_hashing(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs a password hashing call in the hashing thread pool.
+    
+    Args:
+        func (Callable[..., Any]): The Hash method to call.
+        *args (Any): Positional arguments for the call.
+    
+    Returns:
+        Any: The result of the call.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, func, *args)
 
 oauth2_scheme = HTTPBearer()
 
@@ -78,21 +186,41 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None) -
     else:
         expire = datetime.now(UTC) + timedelta(seconds=settings.JWT_EXPIRATION_SECONDS)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
+@functools.lru_cache(maxsize=10_000)
+def _decode_token(token: str) -> tuple[str, int]:
+    """
+    Verifies a JWT token and returns its subject and expiration time.
+
+    Results are cached, so the signature of a token is checked only once
+    and callers must check the expiration time themselves.
+    
+    Args:
+        token (str): The JWT token.
+    
+    Returns:
+        tuple[str, int]: The subject and the expiration timestamp.
+    
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid, expired or has no subject.
+    """
+    payload = jwt.decode(
+        token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options={"require": ["exp", "sub"]}
+    )
+    return payload["sub"], payload["exp"]
+
 async def get_current_user(
     token: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
     Retrieves the current authenticated user from the JWT token.
     
     Args:
         token (HTTPAuthorizationCredentials): The Bearer token credentials.
-        db (Session): The database session dependency.
+        user_service (UserService): The user service dependency.
     
     Returns:
         User: The authenticated user.
@@ -106,32 +234,15 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token.credentials, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        username = payload["sub"]
-        if username is None:
-            raise credentials_exception
-    except JWTError:
+        username, expire = _decode_token(token.credentials)
+        if expire <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    except jwt.InvalidTokenError:
         raise credentials_exception
-    # user_service = UserService(db)
-    # user = await user_service.get_user_by_username(username)
-    # if user is None:
-    #     raise credentials_exception
-    # return user
-
-    cache_key = f"user:{username}"
-    cached_user = cache.get(cache_key)
-    if cached_user:
-        return cached_user
-
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
 
+    user = await get_user_by_username_cached(user_service, username)
     if user is None:
         raise credentials_exception
-    cache.set(cache_key, user)
-
     return user
 
 
@@ -154,7 +265,7 @@ def create_email_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(days=7)
     to_encode.update({"iat": datetime.now(UTC), "exp": expire})
-    token = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    token = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
     return token
 
 async def get_email_from_token(token: str) -> str:
@@ -171,12 +282,11 @@ async def get_email_from_token(token: str) -> str:
         HTTPException: If the token is invalid.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        email = payload["sub"]
+        email, expire = _decode_token(token)
+        if expire <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
         return email
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Invalid token for email verification",
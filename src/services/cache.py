@@ -0,0 +1,261 @@
+"""
+This module provides Redis-backed caching helpers.
+
+It includes a cache-aside layer for user lookups, where users are cached
+by email and username with a short TTL and are invalidated explicitly
+whenever their record changes, and a cooldown for outgoing emails.
+Recently seen users are also kept in process for a few seconds, so most
+requests need no Redis round trip. Concurrent cache misses for the same
+user share one database query.
+"""
+
+import asyncio
+import pickle
+from typing import Awaitable, Callable
+
+import redis.asyncio as redis
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.conf.config import settings
+from src.database.models import User
+from src.services.users import UserService
+
+USER_CACHE_TTL = 60
+EMAIL_COOLDOWN_SECONDS = 60
+
+# In-process copy of recently seen users. Invalidation only reaches the
+# local process, so the TTL bounds how long other workers serve stale data.
+USER_LOCAL_CACHE_TTL = 5
+_local_users = TTLCache(maxsize=10_000, ttl=USER_LOCAL_CACHE_TTL)
+
+# Database loads in flight, by cache key, and the marker a failed load
+# leaves for the callers waiting on it.
+_inflight: dict[str, asyncio.Future] = {}
+_LOAD_FAILED = object()
+
+redis_client = redis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    password=settings.REDIS_PASSWORD,
+    # Fail fast, so an unreachable Redis falls back to the database
+    # instead of stalling every request.
+    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+)
+
+
+def _user_key(field: str, value: str) -> str:
+    """
+    Builds the Redis key under which a user is cached.
+
+    Args:
+        field (str): The lookup field, e.g. ``email`` or ``username``.
+        value (str): The value of the lookup field.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"user:{field}:{value}"
+
+
+def _dump_user(user: User) -> bytes:
+    """
+    Serializes the column values of a user for caching.
+
+    Args:
+        user (User): The user to serialize.
+
+    Returns:
+        bytes: The serialized user.
+    """
+    return pickle.dumps(
+        {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    )
+
+
+def _load_user(data: bytes) -> User:
+    """
+    Restores a cached user as a detached instance.
+
+    The instance keeps its identity, so it can be attached to a session
+    without being inserted again.
+
+    Args:
+        data (bytes): The serialized user.
+
+    Returns:
+        User: The restored user.
+    """
+    user = User(**pickle.loads(data))
+    make_transient_to_detached(user)
+    return user
+
+
+async def _load_once(
+    key: str, loader: Callable[[], Awaitable[User | None]]
+) -> tuple[User | None, bytes | None]:
+    """
+    Loads a user from the database, sharing the query between concurrent callers.
+
+    While a load for a key is in flight, other callers for the same key wait
+    for it instead of issuing their own query. They receive detached copies,
+    never the instance bound to the loading request's session.
+
+    Args:
+        key (str): The cache key.
+        loader (Callable[[], Awaitable[User | None]]): Loads the user from the database.
+
+    Returns:
+        tuple[User | None, bytes | None]: The user if found, otherwise None,
+        and its serialized form if this caller ran the shared load, so that
+        only that caller fills the caches.
+    """
+    pending = _inflight.get(key)
+    if pending is not None:
+        data = await asyncio.shield(pending)
+        if data is _LOAD_FAILED:
+            return await loader(), None
+        return (_load_user(data) if data is not None else None), None
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    data = None
+    try:
+        user = await loader()
+        if user is not None:
+            data = _dump_user(user)
+    except BaseException:
+        future.set_result(_LOAD_FAILED)
+        raise
+    else:
+        future.set_result(data)
+    finally:
+        del _inflight[key]
+    return user, data
+
+
+async def _get_or_load(
+    key: str, loader: Callable[[], Awaitable[User | None]]
+) -> User | None:
+    """
+    Returns the cached user for a key, loading and caching it on a miss.
+
+    The in-process cache is checked first, then Redis, then the database.
+    Redis errors are not fatal: the user is loaded from the database instead.
+
+    Args:
+        key (str): The cache key.
+        loader (Callable[[], Awaitable[User | None]]): Loads the user from the database.
+
+    Returns:
+        User | None: The user if found, otherwise None.
+    """
+    cached = _local_users.get(key)
+    if cached is not None:
+        return _load_user(cached)
+
+    redis_available = True
+    try:
+        cached = await redis_client.get(key)
+    except RedisError as e:
+        print(e)
+        redis_available = False
+    else:
+        if cached:
+            _local_users[key] = cached
+            return _load_user(cached)
+
+    user, data = await _load_once(key, loader)
+    if data is not None:
+        _local_users[key] = data
+        if redis_available:
+            try:
+                await redis_client.set(key, data, ex=USER_CACHE_TTL)
+            except RedisError as e:
+                print(e)
+    return user
+
+
+async def get_user_by_email_cached(
+    user_service: UserService, email: str
+) -> User | None:
+    """
+    Retrieves a user by email, using the cache when possible.
+
+    Args:
+        user_service (UserService): The user service used on a cache miss.
+        email (str): The email address of the user.
+
+    Returns:
+        User | None: The user if found, otherwise None.
+    """
+    return await _get_or_load(
+        _user_key("email", email), lambda: user_service.get_user_by_email(email)
+    )
+
+
+async def get_user_by_username_cached(
+    user_service: UserService, username: str
+) -> User | None:
+    """
+    Retrieves a user by username, using the cache when possible.
+
+    Args:
+        user_service (UserService): The user service used on a cache miss.
+        username (str): The username of the user.
+
+    Returns:
+        User | None: The user if found, otherwise None.
+    """
+    return await _get_or_load(
+        _user_key("username", username),
+        lambda: user_service.get_user_by_username(username),
+    )
+
+
+async def invalidate_user(user: User) -> None:
+    """
+    Removes all cached entries of a user.
+
+    Must be called after every committed change to the user record.
+
+    Args:
+        user (User): The changed user.
+    """
+    _local_users.pop(_user_key("email", user.email), None)
+    _local_users.pop(_user_key("username", user.username), None)
+    try:
+        await redis_client.delete(
+            _user_key("email", user.email), _user_key("username", user.username)
+        )
+    except RedisError as e:
+        print(e)
+
+
+async def acquire_email_cooldown(purpose: str, email: str) -> bool:
+    """
+    Starts the cooldown for sending an email of the given purpose.
+
+    If Redis is unavailable the email is allowed, so users are never locked out.
+
+    Args:
+        purpose (str): The kind of email, e.g. ``confirm`` or ``reset``.
+        email (str): The recipient address.
+
+    Returns:
+        bool: True if the email may be sent now, False if one was sent recently.
+    """
+    try:
+        acquired = await redis_client.set(
+            f"email_cooldown:{purpose}:{email}",
+            "1",
+            ex=EMAIL_COOLDOWN_SECONDS,
+            nx=True,
+        )
+    except RedisError as e:
+        print(e)
+        return True
+    return bool(acquired)
@@ -5,12 +5,29 @@ It interacts with the ContactRepository to perform CRUD operations,
 search contacts, and retrieve upcoming birthdays.
 """
 
+from typing import AsyncIterator, List
+
+from fastapi import Depends
+from sqlalchemy import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.db import get_db
 from src.repository.contacts import ContactRepository
 from src.database.models import User
 from src.schemas.contacts import ContactBase, ContactResponse, ContactBirthdayRequest
 
+def _to_response(contact) -> ContactResponse | None:
+    """
+    Converts a contact read from the database into its response schema.
+    
+    Args:
+        contact: The contact, or None if it was not found.
+    
+    Returns:
+        ContactResponse | None: The response schema, or None.
+    """
+    return ContactResponse.from_orm_fast(contact) if contact is not None else None
+
 class ContactService:
     """
     Service layer for managing contact-related operations.
@@ -33,23 +50,51 @@ class ContactService:
             user (User): The authenticated user.
         
         Returns:
-            Contact: The created contact object.
+            ContactResponse: The created contact.
         """
-        return await self.contact_repository.create_contact(body, user)
+        contact = await self.contact_repository.create_contact(body, user)
+        return ContactResponse.from_orm_fast(contact)
 
-    async def get_contacts(self, skip: int, limit: int, user: User):
+    async def create_contacts(self, bodies: List[ContactBase], user: User):
         """
-        Retrieves a list of contacts for the authenticated user.
+        Creates several contacts for the authenticated user at once.
         
         Args:
-            skip (int): Number of contacts to skip.
+            bodies (List[ContactBase]): The data of each contact.
+            user (User): The authenticated user.
+        
+        Returns:
+            List[ContactResponse]: The created contacts.
+        """
+        contacts = await self.contact_repository.create_contacts(bodies, user)
+        return [ContactResponse.from_orm_fast(contact) for contact in contacts]
+
+    async def get_contacts(self, after_id: int | None, limit: int, user: User):
+        """
+        Retrieves a page of contacts for the authenticated user.
+        
+        Args:
+            after_id (int | None): Return contacts with an ID greater than this.
             limit (int): Maximum number of contacts to return.
             user (User): The authenticated user.
         
         Returns:
-            List[Contact]: A list of contacts.
+            List[ContactResponse]: A list of contacts.
         """
-        return await self.contact_repository.get_contacts(skip, limit, user)
+        contacts = await self.contact_repository.get_contacts(after_id, limit, user)
+        return [ContactResponse.from_orm_fast(contact) for contact in contacts]
+
+    def stream_contacts(self, user: User) -> AsyncIterator[RowMapping]:
+        """
+        Streams all contacts of the authenticated user.
+        
+        Args:
+            user (User): The authenticated user.
+        
+        Returns:
+            AsyncIterator[RowMapping]: The contact rows, ordered by ID.
+        """
+        return self.contact_repository.stream_contacts(user)
 
     async def get_contact(self, contact_id: int, user: User):
         """
@@ -60,9 +105,10 @@ class ContactService:
             user (User): The authenticated user.
         
         Returns:
-            Contact | None: The requested contact if found, otherwise None.
+            ContactResponse | None: The requested contact if found, otherwise None.
         """
-        return await self.contact_repository.get_contacts_by_id(contact_id, user)
+        contact = await self.contact_repository.get_contacts_by_id(contact_id, user)
+        return _to_response(contact)
 
     async def update_contact(self, contact_id: int, body: ContactBase, user: User):
         """
@@ -74,9 +120,10 @@ class ContactService:
             user (User): The authenticated user.
         
         Returns:
-            Contact | None: The updated contact if found, otherwise None.
+            ContactResponse | None: The updated contact if found, otherwise None.
         """
-        return await self.contact_repository.update_contact(contact_id, body, user)
+        contact = await self.contact_repository.update_contact(contact_id, body, user)
+        return _to_response(contact)
 
     async def remove_contact(self, contact_id: int, user: User):
         """
@@ -87,24 +134,29 @@ class ContactService:
             user (User): The authenticated user.
         
         Returns:
-            Contact | None: The deleted contact if found, otherwise None.
+            int | None: The ID of the deleted contact if found, otherwise None.
         """
         return await self.contact_repository.remove_contact(contact_id, user)
     
-    async def search_contacts(self, search: str, skip: int, limit: int, user: User):
+    async def search_contacts(
+        self, search: str, after_id: int | None, limit: int, user: User
+    ):
         """
-        Searches for contacts based on various fields.
+        Searches for a page of contacts based on various fields.
         
         Args:
             search (str): The search query.
-            skip (int): Number of contacts to skip.
+            after_id (int | None): Return contacts with an ID greater than this.
             limit (int): Maximum number of contacts to return.
             user (User): The authenticated user.
         
         Returns:
-            List[Contact]: A list of matching contacts.
+            List[ContactResponse]: A list of matching contacts.
         """
-        return await self.contact_repository.search_contacts(search, skip, limit, user)
+        contacts = await self.contact_repository.search_contacts(
+            search, after_id, limit, user
+        )
+        return [ContactResponse.from_orm_fast(contact) for contact in contacts]
     
     async def get_upcoming_birthdays(self, days: int, user: User):
         """
@@ -115,6 +167,23 @@ class ContactService:
             user (User): The authenticated user.
         
         Returns:
-            List[Contact]: A list of contacts with upcoming birthdays.
+            List[ContactResponse]: A list of contacts with upcoming birthdays.
         """
-        return await self.contact_repository.get_upcoming_birthdays(days, user)
+        contacts = await self.contact_repository.get_upcoming_birthdays(days, user)
+        return [ContactResponse.from_orm_fast(contact) for contact in contacts]
+
+
+def get_contact_service(db: AsyncSession = Depends(get_db)) -> ContactService:
+    """
+    Provides a ContactService bound to the request's database session.
+
+    FastAPI caches dependencies per request, so every dependant of the
+    same request shares one service instance.
+    
+    Args:
+        db (AsyncSession): The database session dependency.
+    
+    Returns:
+        ContactService: The contact service.
+    """
+    return ContactService(db)
@@ -5,9 +5,12 @@ It interacts with the UserRepository to perform user creation, retrieval,
 and updating operations.
 """
 
+import hashlib
+
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
 
+from src.database.db import get_db
 from src.repository.users import UserRepository
 from src.schemas.users import UserCreate
 
@@ -26,7 +29,10 @@ class UserService:
 
     async def create_user(self, body: UserCreate):
         """
-        Creates a new user and assigns a Gravatar avatar if available.
+        Creates a new user with a Gravatar avatar.
+
+        The Gravatar URL only depends on the MD5 hash of the email,
+        so it is built locally.
         
         Args:
             body (UserCreate): The user creation data.
@@ -34,13 +40,8 @@ class UserService:
         Returns:
             User: The newly created user object.
         """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:
-            print(e)
-
+        email_hash = hashlib.md5(body.email.strip().lower().encode()).hexdigest()
+        avatar = f"https://www.gravatar.com/avatar/{email_hash}"
         return await self.repository.create_user(body, avatar)
 
     async def get_user_by_id(self, user_id: int):
@@ -79,6 +80,19 @@ class UserService:
         """
         return await self.repository.get_user_by_email(email)
 
+    async def get_user_by_email_or_username(self, email: str, username: str):
+        """
+        Retrieves a user that has either the given email or the given username.
+        
+        Args:
+            email (str): The email address to look for.
+            username (str): The username to look for.
+        
+        Returns:
+            User | None: The first matching user if found, otherwise None.
+        """
+        return await self.repository.get_user_by_email_or_username(email, username)
+
     async def confirmed_email(self, email: str) -> None:
         """
         Marks a user's email as confirmed.
@@ -88,6 +102,19 @@ class UserService:
         """
         return await self.repository.confirmed_email(email)
 
+    async def update_user(self, user_id: int, data: dict):
+        """
+        Updates the given fields of a user.
+        
+        Args:
+            user_id (int): The ID of the user.
+            data (dict): The field names and their new values.
+        
+        Returns:
+            User | None: The updated user object if found, otherwise None.
+        """
+        return await self.repository.update_user(user_id, data)
+
     async def update_avatar_url(self, email: str, url: str):
         """
         Updates the avatar URL for a user.
@@ -101,3 +128,18 @@ class UserService:
         """
         return await self.repository.update_avatar_url(email, url)
 
+
+def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+    """
+    Provides a UserService bound to the request's database session.
+
+    FastAPI caches dependencies per request, so every dependant of the
+    same request shares one service instance.
+    
+    Args:
+        db (AsyncSession): The database session dependency.
+    
+    Returns:
+        UserService: The user service.
+    """
+    return UserService(db)
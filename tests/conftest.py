@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, Asyn
 
 from main import app
 from src.database.models import Base, User, Contact
-from src.database.db import get_db
+from src.database.db import get_db, get_session_factory
 from src.services.auth import create_access_token, Hash
 
 SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
@@ -62,6 +62,7 @@ def client():
                 raise
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
 
     yield TestClient(app)
 
@@ -1,9 +1,12 @@
-from unittest.mock import Mock
+import time
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+import bcrypt
 from sqlalchemy import select
 
 from src.database.models import User
+from src.services.auth import create_access_token, create_email_token
 from tests.conftest import TestingSessionLocal
 from src.conf import messages
 
@@ -40,6 +43,17 @@ async def test_repeat_signup(client, monkeypatch):
     assert data["detail"] == messages.API_ERROR_USER_ALREADY_EXIST
 
 
+def test_repeat_signup_same_username(client, monkeypatch):
+    mock_send_email = Mock()
+    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    response = client.post(
+        "api/auth/register", json={**user_data, "email": "other007@gmail.com"}
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT, response.text
+    data = response.json()
+    assert data["detail"] == messages.API_ERROR_USER_ALREADY_EXIST
+
+
 def test_not_confirmed_login(client):
     response = client.post(
         "api/auth/login",
@@ -67,6 +81,26 @@ async def test_login(client):
     assert "token_type" in data
     assert data["token_type"] == "bearer", f'token_type should be {data["token_type"]}'
 
+@pytest.mark.asyncio
+async def test_login_upgrades_legacy_hash(client):
+    legacy_hash = bcrypt.hashpw(
+        user_data.get("password").encode(), bcrypt.gensalt()
+    ).decode()
+    async with TestingSessionLocal() as session:
+        current_user = await session.execute(select(User).where(User.email == user_data.get("email")))
+        current_user = current_user.scalar_one()
+        current_user.hashed_password = legacy_hash
+        await session.commit()
+
+    response = client.post("api/auth/login",
+                           json={"email": user_data.get("email"), "password": user_data.get("password")})
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    async with TestingSessionLocal() as session:
+        current_user = await session.execute(select(User).where(User.email == user_data.get("email")))
+        current_user = current_user.scalar_one()
+    assert current_user.hashed_password.startswith("$argon2id$")
+
 def test_wrong_password_login(client):
     response = client.post("api/auth/login",
                            json={"email": user_data.get("email"), "password": "wrong-password"})
@@ -96,4 +130,84 @@ def test_request_email(client):
     assert response.status_code == status.HTTP_200_OK, response.text
     data = response.json()
     # pprint(data)
-    assert data["message"] == messages.API_EMAIL_CONFIRMED
\ No newline at end of file
+    assert data["message"] == messages.API_EMAIL_CONFIRMED
+
+def test_request_email_unknown_user(client):
+    response = client.post(
+        "api/auth/request_email",
+        json={"email": "unknown@gmail.com"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert data["message"] == "Check your email for confirmation"
+
+def test_confirmed_email(client):
+    token = create_email_token({"sub": user_data.get("email")})
+    response = client.get(f"api/auth/confirmed_email/{token}")
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert data["message"] == messages.API_EMAIL_CONFIRMED
+
+def test_confirmed_email_invalid_token(client):
+    response = client.get("api/auth/confirmed_email/invalid-token")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+@pytest.mark.asyncio
+async def test_expired_access_token_after_caching(client, monkeypatch):
+    token = await create_access_token(data={"sub": user_data.get("username")}, expires_delta=60)
+    headers = {"Authorization": f"Bearer {token}"}
+    response = client.get("api/users/me", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    monkeypatch.setattr("src.services.auth.time", Mock(time=Mock(return_value=time.time() + 120)))
+    response = client.get("api/users/me", headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+def test_expired_email_token_after_caching(client, monkeypatch):
+    token = create_email_token({"sub": user_data.get("email")})
+    response = client.get(f"api/auth/confirmed_email/{token}")
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    expired = time.time() + 8 * 24 * 60 * 60
+    monkeypatch.setattr("src.services.auth.time", Mock(time=Mock(return_value=expired)))
+    response = client.get(f"api/auth/confirmed_email/{token}")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+def test_wrong_password_after_cached_login(client):
+    response = client.post("api/auth/login",
+                           json={"email": user_data.get("email"), "password": user_data.get("password")})
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = client.post("api/auth/login",
+                           json={"email": user_data.get("email"), "password": "wrong-password"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+
+def test_update_password_rejects_old_password(client):
+    old_login = {"email": user_data.get("email"), "password": user_data.get("password")}
+    response = client.post("api/auth/login", json=old_login)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    token = create_email_token({"sub": user_data.get("email")})
+    response = client.patch(f"api/auth/update_password/{token}", json={"password": "new-password"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = client.post("api/auth/login", json=old_login)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response.text
+    response = client.post("api/auth/login",
+                           json={"email": user_data.get("email"), "password": "new-password"})
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+def test_email_cooldown_skips_sending(client, monkeypatch):
+    mock_send_email = Mock()
+    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    new_user = {"username": "cooldown", "email": "cooldown@gmail.com", "password": "12345678"}
+    response = client.post("api/auth/register", json=new_user)
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    mock_send_email.reset_mock()
+
+    monkeypatch.setattr("src.api.auth.acquire_email_cooldown", AsyncMock(return_value=False))
+    response = client.post("api/auth/request_email", json={"email": new_user["email"]})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response = client.post("api/auth/reset_password", json={"email": new_user["email"]})
+    assert response.status_code == status.HTTP_200_OK, response.text
+    mock_send_email.assert_not_called()
@@ -1,6 +1,7 @@
 from datetime import date
 
 from fastapi import status
+from src.api.contacts import MAX_BULK_CONTACTS
 from src.conf import messages
 
 test_contact = {
@@ -58,6 +59,28 @@ def test_get_contacts(client, get_token):
     assert len(data) > 0
 
 
+def test_get_contacts_next_cursor(client, get_token):
+    response = client.get(
+        "/api/contacts",
+        params={"limit": 1},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert len(data) == 1
+    next_cursor = response.headers["X-Next-Cursor"]
+    assert next_cursor == str(data[0]["id"])
+
+    response = client.get(
+        "/api/contacts",
+        params={"after_id": next_cursor},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
 def test_update_contact(client, get_token):
     updated_test_contact = test_contact.copy()
     updated_test_contact["first_name"] = "New-Name"
@@ -88,6 +111,17 @@ def test_update_contact_not_found(client, get_token):
     assert data["detail"] == messages.CONTACT_NOT_FOUND
 
 
+def test_upcoming_birthdays(client, get_token):
+    response = client.post(
+        "/api/contacts/upcoming-birthdays",
+        json={"days": 7},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert isinstance(data, list)
+
+
 def test_delete_contact(client, get_token):
     response = client.delete(
         "/api/contacts/1", headers={"Authorization": f"Bearer {get_token}"}
@@ -103,4 +137,56 @@ def test_repeat_delete_contact(client, get_token):
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
     data = response.json()
-    assert data["detail"] == messages.CONTACT_NOT_FOUND
\ No newline at end of file
+    assert data["detail"] == messages.CONTACT_NOT_FOUND
+
+
+def test_export_contacts_empty(client, get_token):
+    response = client.get(
+        "/api/contacts/export", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == []
+
+
+def test_create_contacts_bulk(client, get_token):
+    second_contact = {**test_contact, "first_name": "Second", "email": "user2@mail.com"}
+
+    response = client.post(
+        "/api/contacts/bulk",
+        json=[test_contact, second_contact],
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.text
+    data = response.json()
+    assert [contact["first_name"] for contact in data] == ["First", "Second"]
+    assert len({contact["id"] for contact in data}) == 2
+
+
+def test_create_contacts_bulk_empty(client, get_token):
+    response = client.post(
+        "/api/contacts/bulk",
+        json=[],
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+
+def test_create_contacts_bulk_over_limit(client, get_token):
+    response = client.post(
+        "/api/contacts/bulk",
+        json=[test_contact] * (MAX_BULK_CONTACTS + 1),
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY, response.text
+
+
+def test_export_contacts(client, get_token):
+    response = client.get(
+        "/api/contacts/export", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert [contact["first_name"] for contact in data] == ["First", "Second"]
+    assert data[0]["email"] == test_contact["email"]
+    assert data[0]["birthday"] == test_contact["birthday"]
@@ -0,0 +1,74 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import status
+
+from main import app
+from src.api import utils
+from src.conf import messages
+from src.database.db import get_db
+
+
+def test_healthchecker(client):
+    response = client.get("/api/healthchecker")
+    assert response.status_code == status.HTTP_200_OK, response.text
+    data = response.json()
+    assert data["message"] == messages.HEALTHCHECKER_MESSAGE
+
+
+class CountingSession:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.executed = 0
+
+    async def execute(self, statement):
+        self.executed += 1
+        if self.fail:
+            raise ConnectionError("database is down")
+        return MagicMock(scalar_one_or_none=MagicMock(return_value=1))
+
+
+@pytest.fixture
+def override_db(monkeypatch):
+    monkeypatch.setitem(utils._health_cache, "ok", False)
+    monkeypatch.setitem(utils._health_cache, "ts", 0.0)
+    previous = app.dependency_overrides[get_db]
+
+    def override(session):
+        async def get_session():
+            yield session
+
+        app.dependency_overrides[get_db] = get_session
+
+    yield override
+    app.dependency_overrides[get_db] = previous
+
+
+def test_healthchecker_cached(client, override_db):
+    session = CountingSession()
+    override_db(session)
+    response = client.get("/api/healthchecker")
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert session.executed == 1
+
+    failing = CountingSession(fail=True)
+    override_db(failing)
+    response = client.get("/api/healthchecker")
+    assert response.status_code == status.HTTP_200_OK, response.text
+    assert response.json()["message"] == messages.HEALTHCHECKER_MESSAGE
+    assert failing.executed == 0
+
+
+def test_healthchecker_failure_clears_cache(client, override_db, monkeypatch):
+    monkeypatch.setitem(utils._health_cache, "ok", True)
+    monkeypatch.setitem(
+        utils._health_cache, "ts", time.monotonic() - utils.HEALTH_CACHE_SECONDS
+    )
+    failing = CountingSession(fail=True)
+    override_db(failing)
+
+    response = client.get("/api/healthchecker")
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert failing.executed == 1
+    assert utils._health_cache["ok"] is False
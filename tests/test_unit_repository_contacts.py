@@ -52,31 +52,21 @@ async def test_get_contacts(contact_repository, mock_session, user):
     mock_result = MagicMock()
 
     contacts_to_get = [
-        Contact(
-            id=i + 1,
-            first_name=contact["first_name"],
-            last_name=contact["last_name"],
-            email=contact["email"],
-            phone_number=contact["phone_number"],
-            birthday=contact["birthday"],
-            additional_data=contact["additional_data"],
-            user=user,
-        )
-        for i, contact in enumerate(test_contacts[:2])
+        {"id": i + 1, **contact} for i, contact in enumerate(test_contacts[:2])
     ]
 
-    mock_result.scalars.return_value.all.return_value = contacts_to_get
+    mock_result.mappings.return_value.all.return_value = contacts_to_get
     mock_session.execute = AsyncMock(return_value=mock_result)
 
-    contacts = await contact_repository.get_contacts(skip=0, limit=10, user=user)
+    contacts = await contact_repository.get_contacts(after_id=None, limit=10, user=user)
 
     assert len(contacts) == 2
-    assert contacts[0].first_name == test_contacts[0]["first_name"]
-    assert contacts[0].last_name == test_contacts[0]["last_name"]
-    assert contacts[0].email == test_contacts[0]["email"]
-    assert contacts[0].phone_number == test_contacts[0]["phone_number"]
-    assert contacts[0].birthday == test_contacts[0]["birthday"]
-    assert contacts[0].additional_data == test_contacts[0]["additional_data"]
+    assert contacts[0]["first_name"] == test_contacts[0]["first_name"]
+    assert contacts[0]["last_name"] == test_contacts[0]["last_name"]
+    assert contacts[0]["email"] == test_contacts[0]["email"]
+    assert contacts[0]["phone_number"] == test_contacts[0]["phone_number"]
+    assert contacts[0]["birthday"] == test_contacts[0]["birthday"]
+    assert contacts[0]["additional_data"] == test_contacts[0]["additional_data"]
     assert contacts == contacts_to_get
 
 
@@ -117,26 +107,23 @@ async def test_create_contact_existing_user(contact_repository, mock_session, us
         additional_data=test_contacts[0]["additional_data"],
     )
 
+    created_contact = Contact(id=1, **body.model_dump(), user_id=user.id)
+    mock_result = MagicMock()
+    mock_result.scalar_one.return_value = created_contact
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
     contact = await contact_repository.create_contact(body, user)
 
-    assert contact.user == user
-    mock_session.add.assert_called_once_with(contact)
-    mock_session.commit.assert_called_once()
-    mock_session.refresh.assert_called_once_with(contact)
+    assert contact is created_contact
+    assert contact.user_id == user.id
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+    mock_session.refresh.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_update_contact(contact_repository, mock_session, user):
 
-    contact_old = Contact(
-        id=1,
-        first_name=test_contacts[0]["first_name"],
-        last_name=test_contacts[0]["last_name"],
-        email=test_contacts[0]["email"],
-        phone_number=test_contacts[0]["phone_number"],
-        birthday=test_contacts[0]["birthday"],
-        additional_data=test_contacts[0]["additional_data"],
-    )
     contact_new = ContactBase(
         first_name="updated first name",
         last_name="updated last name",
@@ -145,8 +132,9 @@ async def test_update_contact(contact_repository, mock_session, user):
         birthday=str(date(2020, 1, 1)),
         additional_data="updated additional data",
     )
+    contact_updated = Contact(id=1, **contact_new.model_dump(), user_id=user.id)
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = contact_old
+    mock_result.scalar_one_or_none.return_value = contact_updated
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     result = await contact_repository.update_contact(
@@ -160,38 +148,37 @@ async def test_update_contact(contact_repository, mock_session, user):
     assert result.phone_number == contact_new.phone_number
     assert result.birthday == contact_new.birthday
     assert result.additional_data == contact_new.additional_data
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(contact_old)
+    mock_session.refresh.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_remove_contact(contact_repository, mock_session, user):
-    existing_contact = Contact(
-        id=1,
-        first_name=test_contacts[0]["first_name"],
-        last_name=test_contacts[0]["last_name"],
-        email=test_contacts[0]["email"],
-        phone_number=test_contacts[0]["phone_number"],
-        birthday=test_contacts[0]["birthday"],
-        additional_data=test_contacts[0]["additional_data"],
-    )
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
+    mock_result.scalar_one_or_none.return_value = 1
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     result = await contact_repository.remove_contact(contact_id=1, user=user)
-   
-    assert result is not None
-    assert result.first_name == existing_contact.first_name
-    assert result.last_name == existing_contact.last_name
-    assert result.email == existing_contact.email
-    assert result.phone_number == existing_contact.phone_number
-    assert result.birthday == existing_contact.birthday
-    assert result.additional_data == existing_contact.additional_data
-    mock_session.delete.assert_awaited_once_with(existing_contact)
+
+    assert result == 1
+    mock_session.execute.assert_awaited_once()
+    mock_session.delete.assert_not_called()
     mock_session.commit.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_remove_contact_not_found(contact_repository, mock_session, user):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = None
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    result = await contact_repository.remove_contact(contact_id=999, user=user)
+
+    assert result is None
+    mock_session.execute.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_search_contacts_valid_query(
     contact_repository, mock_session, user, client
@@ -220,8 +207,67 @@ async def test_search_contacts_valid_query(
 
         search_query = contact_to_search.first_name
         contacts = await contact_repository.search_contacts(
-            search=search_query, skip=0, limit=100, user=user
+            search=search_query, after_id=None, limit=100, user=user
         )
   
     assert len(contacts) >= 1
-    assert contact_to_search.id in [contact.id for contact in contacts]
\ No newline at end of file
+    assert contact_to_search.id in [contact["id"] for contact in contacts]
+
+@pytest.mark.asyncio
+async def test_get_upcoming_birthdays(contact_repository, user, client):
+    user = User(id=100)
+    soon = date.today() + timedelta(days=3)
+    later = date.today() + timedelta(days=100)
+    contacts_to_db = [
+        Contact(
+            first_name=f"birthday{i}",
+            last_name="last",
+            email=f"birthday{i}@mail.com",
+            phone_number="0676650154",
+            birthday=date(1992, birthday.month, birthday.day),
+            user=user,
+        )
+        for i, birthday in enumerate([soon, later])
+    ]
+
+    async with TestingSessionLocal() as session:
+        session.add_all(contacts_to_db)
+        await session.commit()
+
+        contact_repository.db = session
+
+        contacts = await contact_repository.get_upcoming_birthdays(days=7, user=user)
+
+    found_ids = [contact["id"] for contact in contacts]
+    assert contacts_to_db[0].id in found_ids
+    assert contacts_to_db[1].id not in found_ids
+
+
+@pytest.mark.asyncio
+async def test_stream_contacts(contact_repository, client):
+    user = User(id=200)
+    contacts_to_db = [
+        Contact(
+            first_name=f"stream{i}",
+            last_name="last",
+            email=f"stream{i}@mail.com",
+            phone_number="0676650154",
+            birthday=date(1990, 1, i + 1),
+            user=user,
+        )
+        for i in range(3)
+    ]
+
+    async with TestingSessionLocal() as session:
+        session.add_all(contacts_to_db)
+        await session.commit()
+
+        contact_repository.db = session
+
+        contacts = [
+            contact async for contact in contact_repository.stream_contacts(user)
+        ]
+
+    assert [contact["id"] for contact in contacts] == [
+        contact.id for contact in contacts_to_db
+    ]
@@ -0,0 +1,227 @@
+import asyncio
+
+import pytest
+from redis.exceptions import RedisError
+from sqlalchemy import inspect
+
+from src.database.models import User, UserRole
+from src.services import cache
+
+USER_KEY = "user:username:cached"
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.calls = []
+        self.fail_get = False
+        self.fail_set = False
+
+    async def get(self, key):
+        self.calls.append(("get", key))
+        if self.fail_get:
+            raise RedisError("get failed")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        self.calls.append(("set", key))
+        if self.fail_set:
+            raise RedisError("set failed")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        self.calls.append(("delete", *keys))
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakeUserService:
+    def __init__(self, loader):
+        self.loader = loader
+        self.calls = 0
+
+    async def get_user_by_username(self, username):
+        self.calls += 1
+        return await self.loader(self.calls)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "redis_client", fake)
+    cache._local_users.clear()
+    yield fake
+    cache._local_users.clear()
+
+
+@pytest.fixture
+def user():
+    return User(
+        id=1,
+        username="cached",
+        email="cached@example.com",
+        hashed_password="hash",
+        confirmed=True,
+        role=UserRole.USER,
+    )
+
+
+def redis_sets(fake_redis):
+    return [call for call in fake_redis.calls if call[0] == "set"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(fake_redis, user):
+    release = asyncio.Event()
+
+    async def loader(call):
+        await release.wait()
+        return user
+
+    service = FakeUserService(loader)
+    tasks = [
+        asyncio.create_task(cache.get_user_by_username_cached(service, "cached"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    owner, *waiters = await asyncio.gather(*tasks)
+
+    assert service.calls == 1
+    assert owner is user
+    assert waiters[0] is not waiters[1]
+    for waiter in waiters:
+        assert waiter is not user
+        assert inspect(waiter).detached
+        assert waiter.id == user.id
+        assert waiter.username == user.username
+    assert redis_sets(fake_redis) == [("set", USER_KEY)]
+    assert USER_KEY not in cache._inflight
+
+
+@pytest.mark.asyncio
+async def test_failed_load_makes_waiters_query_themselves(fake_redis, user):
+    release = asyncio.Event()
+
+    async def loader(call):
+        if call == 1:
+            await release.wait()
+            raise RuntimeError("database error")
+        return user
+
+    service = FakeUserService(loader)
+    owner = asyncio.create_task(cache.get_user_by_username_cached(service, "cached"))
+    waiter = asyncio.create_task(cache.get_user_by_username_cached(service, "cached"))
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        await owner
+    assert await waiter is user
+    assert service.calls == 2
+    assert USER_KEY not in cache._inflight
+
+
+@pytest.mark.asyncio
+async def test_cancelled_load_makes_waiters_query_themselves(fake_redis, user):
+    async def loader(call):
+        if call == 1:
+            await asyncio.Event().wait()
+        return user
+
+    service = FakeUserService(loader)
+    owner = asyncio.create_task(cache.get_user_by_username_cached(service, "cached"))
+    waiter = asyncio.create_task(cache.get_user_by_username_cached(service, "cached"))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert await waiter is user
+    assert service.calls == 2
+    assert USER_KEY not in cache._inflight
+
+
+@pytest.mark.asyncio
+async def test_local_hit_skips_redis_and_database(fake_redis, user):
+    cache._local_users[USER_KEY] = cache._dump_user(user)
+
+    async def loader(call):
+        raise AssertionError("the database must not be queried")
+
+    cached = await cache.get_user_by_username_cached(FakeUserService(loader), "cached")
+
+    assert cached.id == user.id
+    assert inspect(cached).detached
+    assert fake_redis.calls == []
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_fills_local_cache(fake_redis, user):
+    fake_redis.data[USER_KEY] = cache._dump_user(user)
+
+    async def loader(call):
+        raise AssertionError("the database must not be queried")
+
+    cached = await cache.get_user_by_username_cached(FakeUserService(loader), "cached")
+
+    assert cached.id == user.id
+    assert cache._local_users[USER_KEY] == fake_redis.data[USER_KEY]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_clears_both_caches(fake_redis, user):
+    async def loader(call):
+        return user
+
+    await cache.get_user_by_username_cached(FakeUserService(loader), "cached")
+    assert USER_KEY in cache._local_users
+    assert USER_KEY in fake_redis.data
+
+    await cache.invalidate_user(user)
+
+    assert USER_KEY not in cache._local_users
+    assert USER_KEY not in fake_redis.data
+
+
+@pytest.mark.asyncio
+async def test_redis_get_error_falls_back_to_database(fake_redis, user):
+    fake_redis.fail_get = True
+
+    async def loader(call):
+        return user
+
+    service = FakeUserService(loader)
+    assert await cache.get_user_by_username_cached(service, "cached") is user
+    assert service.calls == 1
+    assert redis_sets(fake_redis) == []
+
+
+@pytest.mark.asyncio
+async def test_redis_set_error_still_returns_user(fake_redis, user):
+    fake_redis.fail_set = True
+
+    async def loader(call):
+        return user
+
+    service = FakeUserService(loader)
+    assert await cache.get_user_by_username_cached(service, "cached") is user
+    assert USER_KEY in cache._local_users
+
+
+@pytest.mark.asyncio
+async def test_email_cooldown(fake_redis):
+    assert await cache.acquire_email_cooldown("confirm", "user@example.com")
+    assert not await cache.acquire_email_cooldown("confirm", "user@example.com")
+    assert await cache.acquire_email_cooldown("reset", "user@example.com")
+
+
+@pytest.mark.asyncio
+async def test_email_cooldown_allows_sending_without_redis(fake_redis):
+    fake_redis.fail_set = True
+
+    assert await cache.acquire_email_cooldown("confirm", "user@example.com")
+    assert await cache.acquire_email_cooldown("confirm", "user@example.com")